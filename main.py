@@ -3,15 +3,47 @@ Informatica Mapping XML Parser - Simple Version
 Parses Informatica mapping XML and creates in-memory model
 """
 
-import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+try:
+    # Compiled port builder, see parser_fast.pyx and setup.py
+    from parser_fast import build_port as _build_port_fast
+except ImportError:
+    _build_port_fast = None
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional, Tuple
 from pathlib import Path
+from xml.parsers import expat
 from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 import json
+import sys
 
 
-@dataclass
+def _to_int(value: Optional[str]) -> Optional[int]:
+    """Convert string to int, or None if it isn't a valid integer
+    
+    >>> _to_int('12'), _to_int('-3'), _to_int(''), _to_int('abc')
+    (12, -3, None, None)
+    >>> _to_int('9' * 5000) is None  # beyond int()'s digit limit
+    True
+    """
+    # Empty values are common and skip the exception path
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class Port:
     """Represents a port in a transformation"""
     name: str
@@ -26,7 +58,7 @@ class Port:
         return f"Port({self.name}, {self.datatype}, {self.port_type})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Transformation:
     """Represents an Informatica transformation"""
     name: str
@@ -39,7 +71,7 @@ class Transformation:
         return f"Transformation({self.name}, type={self.type}, ports={len(self.ports)})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Connection:
     """Represents a connection between transformations"""
     from_transformation: str
@@ -51,33 +83,96 @@ class Connection:
         return f"{self.from_transformation}.{self.from_port} -> {self.to_transformation}.{self.to_port}"
 
 
-@dataclass
+@dataclass(slots=True)
 class Mapping:
     """Represents an Informatica mapping"""
     name: str
     description: Optional[str] = None
     folder: Optional[str] = None
+    # Appending to this list or assigning a new one is picked up by the derived
+    # data below; replacing or removing items in place, or changing a
+    # transformation's name or type after it was added, needs reindex()
     transformations: List[Transformation] = field(default_factory=list)
     connections: List[Connection] = field(default_factory=list)
+    # Transformation types, parallel to transformations, for bulk scans
+    _types: List[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    # List object and length the derived data was last built from (see _sync)
+    _indexed: Optional[List[Transformation]] = field(default=None, init=False, repr=False, compare=False)
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+    # First transformation seen for each name
+    _by_name: Dict[str, Transformation] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # Cached results of sources/targets/transformation_counts
+    _sources: Optional[List[Transformation]] = field(default=None, init=False, repr=False, compare=False)
+    _targets: Optional[List[Transformation]] = field(default=None, init=False, repr=False, compare=False)
+    _counts: Optional[Dict[str, int]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def add_transformation(self, transformation: Transformation):
+        """Append a transformation"""
+        self.transformations.append(transformation)
+    
+    def reindex(self):
+        """Rebuild derived data after editing transformations in place"""
+        self._indexed = None
+        self._sync()
+    
+    def _sync(self):
+        """Bring derived data up to date with the transformations list"""
+        transformations = self.transformations
+        count = len(transformations)
+        if transformations is not self._indexed or count < self._indexed_count:
+            # New list or items removed: start over
+            self._types = []
+            self._by_name = {}
+            self._sources = self._targets = self._counts = None
+            self._indexed = transformations
+            self._indexed_count = 0
+        if count > self._indexed_count:
+            # Items appended: index just the new tail
+            self._sources = self._targets = self._counts = None
+            new = transformations[self._indexed_count:]
+            self._types.extend(t.type for t in new)
+            by_name = self._by_name
+            for trans in new:
+                by_name.setdefault(trans.name, trans)
+            self._indexed_count = count
     
     def get_transformation_by_name(self, name: str) -> Optional[Transformation]:
         """Get transformation by name"""
-        for trans in self.transformations:
-            if trans.name == name:
-                return trans
-        return None
-    
-    def get_sources(self) -> List[Transformation]:
-        """Get all source transformations"""
-        return [t for t in self.transformations if t.type == "Source Definition"]
-    
-    def get_targets(self) -> List[Transformation]:
-        """Get all target transformations"""
-        return [t for t in self.transformations if t.type == "Target Definition"]
-    
-    def get_transformation_counts(self) -> Dict[str, int]:
-        """Count transformations by type"""
-        return dict(Counter(t.type for t in self.transformations))
+        self._sync()
+        return self._by_name.get(name)
+    
+    def get_unresolved_connections(self) -> List[Connection]:
+        """Get connections whose endpoints don't name a transformation in the mapping"""
+        self._sync()
+        by_name = self._by_name
+        return [c for c in self.connections
+                if c.from_transformation not in by_name or c.to_transformation not in by_name]
+    
+    @property
+    def sources(self) -> List[Transformation]:
+        """All source transformations (cached)"""
+        self._sync()
+        if self._sources is None:
+            self._sources = [t for t, t_type in zip(self.transformations, self._types)
+                             if t_type == "Source Definition"]
+        return self._sources
+    
+    @property
+    def targets(self) -> List[Transformation]:
+        """All target transformations (cached)"""
+        self._sync()
+        if self._targets is None:
+            self._targets = [t for t, t_type in zip(self.transformations, self._types)
+                             if t_type == "Target Definition"]
+        return self._targets
+    
+    @property
+    def transformation_counts(self) -> Dict[str, int]:
+        """Transformation counts by type (cached)"""
+        self._sync()
+        if self._counts is None:
+            self._counts = dict(Counter(self._types))
+        return self._counts
     
     def get_summary(self) -> Dict:
         """Get mapping summary"""
@@ -86,9 +181,9 @@ class Mapping:
             "folder": self.folder,
             "total_transformations": len(self.transformations),
             "total_connections": len(self.connections),
-            "sources": len(self.get_sources()),
-            "targets": len(self.get_targets()),
-            "transformation_counts": self.get_transformation_counts()
+            "sources": len(self.sources),
+            "targets": len(self.targets),
+            "transformation_counts": self.transformation_counts
         }
     
     def __repr__(self):
@@ -121,306 +216,412 @@ class InformaticaXMLParser:
     def __init__(self, xml_path: str):
         """Initialize parser with XML file path"""
         self.xml_path = Path(xml_path)
-        self.tree = None
-        self.root = None
-        self.namespace = {}
         
     def parse(self) -> Mapping:
         """Parse the XML file and return Mapping object"""
-        # Load and parse XML
-        self.tree = ET.parse(self.xml_path)
-        self.root = self.tree.getroot()
-        
-        # Extract namespace if present
-        self._extract_namespace()
-        
-        # Find the mapping element
-        mapping_elem = self._find_element('.//MAPPING')
-        if mapping_elem is None:
-            raise ValueError("No MAPPING element found in XML")
+        # Visitors for direct children of MAPPING, keyed by tag
+        mapping_visitors = {
+            'TRANSFORMATION': self._visit_transformation,
+            'CONNECTOR': self._visit_connector,
+        }
+        # Visitors for direct children of the open TRANSFORMATION, keyed by tag
+        transformation_visitors = {
+            'TRANSFORMFIELD': self._visit_transformfield,
+            'TABLEATTRIBUTE': self._visit_tableattribute,
+        }
+        mapping = None
+        mapping_depth = 0
+        transformation = None
+        folder = None
+        open_elems = []
         
-        # Create mapping object
-        mapping = Mapping(
-            name=mapping_elem.get('NAME', 'Unknown'),
-            description=mapping_elem.get('DESCRIPTION'),
-            folder=self._get_folder_name()
-        )
+        # Local bindings for the per-element loop
+        push_elem = open_elems.append
+        pop_elem = open_elems.pop
+        get_mapping_visitor = mapping_visitors.get
+        get_transformation_visitor = transformation_visitors.get
         
-        # Parse all transformations
-        mapping.transformations = self._parse_transformations(mapping_elem)
+        # Stream the XML in a single pass; every element is visited on its
+        # start event and detached from its parent once it ends
+        with open(self.xml_path, 'rb') as xml_file:
+            for event, elem in ET.iterparse(xml_file, events=('start', 'end')):
+                if event == 'start':
+                    push_elem(elem)
+                    tag = elem.tag
+                    if mapping is None:
+                        if tag == 'FOLDER' and folder is None:
+                            folder = elem.get('NAME')
+                        elif tag == 'MAPPING':
+                            mapping = Mapping(
+                                name=elem.get('NAME', 'Unknown'),
+                                description=elem.get('DESCRIPTION'),
+                                folder=folder
+                            )
+                            mapping_depth = len(open_elems)
+                        continue
+                    
+                    depth = len(open_elems) - mapping_depth
+                    if depth == 1:
+                        visitor = get_mapping_visitor(tag)
+                        if visitor is not None:
+                            transformation = visitor(mapping, elem)
+                    elif depth == 2 and transformation is not None:
+                        visitor = get_transformation_visitor(tag)
+                        if visitor is not None:
+                            visitor(transformation, elem)
+                    continue
+                
+                pop_elem()
+                if mapping is not None:
+                    depth = len(open_elems) - mapping_depth
+                    if depth == 0:
+                        transformation = None
+                    elif depth < 0:
+                        # Only the first mapping is parsed
+                        break
+                
+                if open_elems:
+                    open_elems[-1].remove(elem)
         
-        # Parse all connections
-        mapping.connections = self._parse_connections(mapping_elem)
+        if mapping is None:
+            raise ValueError("No MAPPING element found in XML")
         
         return mapping
     
-    def _extract_namespace(self):
-        """Extract XML namespace if present"""
-        # Informatica XMLs may or may not have namespaces
-        if self.root.tag.startswith('{'):
-            self.namespace = {'ns': self.root.tag.split('}')[0].strip('{')}
-    
-    def _find_element(self, path: str):
-        """Find element with or without namespace"""
-        elem = self.root.find(path, self.namespace)
-        if elem is None and self.namespace:
-            # Try without namespace
-            elem = self.root.find(path)
-        return elem
-    
-    def _find_all_elements(self, path: str):
-        """Find all elements with or without namespace"""
-        elems = self.root.findall(path, self.namespace)
-        if not elems and self.namespace:
-            # Try without namespace
-            elems = self.root.findall(path)
-        return elems
-    
-    def _get_folder_name(self) -> Optional[str]:
-        """Extract folder name from XML"""
-        folder_elem = self._find_element('.//FOLDER')
-        return folder_elem.get('NAME') if folder_elem is not None else None
-    
-    def _parse_transformations(self, mapping_elem) -> List[Transformation]:
-        """Parse all transformations in the mapping"""
-        transformations = []
+    def _visit_transformation(self, mapping: Mapping, trans_elem) -> Transformation:
+        """Add a TRANSFORMATION to the mapping; its ports and properties follow"""
+        get = trans_elem.get
+        trans_type = get('TYPE', 'Unknown')
+        trans_name = get('NAME', 'Unknown')
+        trans_desc = get('DESCRIPTION')
         
-        # Find all transformation elements
-        trans_elements = mapping_elem.findall('.//TRANSFORMATION')
+        # All attributes start out as properties. Plain attribute dicts (expat's,
+        # or the stdlib backend's attrib, which is dropped with the element since
+        # it is detached, never cleared) are taken over as-is instead of copied.
+        attrib = getattr(trans_elem, 'attrib', trans_elem)
+        properties = attrib if type(attrib) is dict else dict(trans_elem.items())
         
-        for trans_elem in trans_elements:
-            trans_type = trans_elem.get('TYPE', 'Unknown')
-            trans_name = trans_elem.get('NAME', 'Unknown')
-            trans_desc = trans_elem.get('DESCRIPTION')
-            
-            # Create transformation object
-            transformation = Transformation(
-                name=trans_name,
-                type=self.TRANSFORMATION_TYPES.get(trans_type, trans_type),
-                description=trans_desc
-            )
-            
-            # Parse ports
-            transformation.ports = self._parse_ports(trans_elem)
-            
-            # Parse transformation-specific properties
-            transformation.properties = self._parse_properties(trans_elem)
-            
-            transformations.append(transformation)
+        # Create transformation object
+        transformation = Transformation(
+            name=trans_name,
+            type=sys.intern(self.TRANSFORMATION_TYPES.get(trans_type, trans_type)),
+            description=trans_desc,
+            properties=properties
+        )
         
-        return transformations
-    
-    def _parse_ports(self, trans_elem) -> List[Port]:
-        """Parse all ports in a transformation"""
-        ports = []
+        mapping.add_transformation(transformation)
+        return transformation
+    
+    def _visit_transformfield(self, transformation: Transformation, port_elem):
+        """Add a TRANSFORMFIELD element as a port of the transformation"""
+        if _build_port_fast is not None:
+            transformation.ports.append(_build_port_fast(Port, port_elem))
+            return
         
-        # Find all TRANSFORMFIELD elements (ports)
-        port_elements = trans_elem.findall('.//TRANSFORMFIELD')
+        # Categorical values repeat across ports, so share one string each
+        get = port_elem.get
+        intern = sys.intern
+        transformation.ports.append(Port(
+            name=get('NAME', 'Unknown'),
+            datatype=intern(get('DATATYPE', 'string')),
+            precision=_to_int(get('PRECISION')),
+            scale=_to_int(get('SCALE')),
+            nullable=intern(get('NULLABLE', 'NOTNULL')),
+            port_type=intern(get('PORTTYPE', 'INPUT')),
+            expression=get('EXPRESSION')
+        ))
+    
+    def _visit_tableattribute(self, transformation: Transformation, prop_elem):
+        """Add a TABLEATTRIBUTE element to the transformation properties"""
+        prop_name = prop_elem.get('NAME')
+        prop_value = prop_elem.get('VALUE')
+        if prop_name and prop_value:
+            transformation.properties[prop_name] = prop_value
+    
+    def _visit_connector(self, mapping: Mapping, conn_elem):
+        """Add a CONNECTOR element (link between transformations) to the mapping"""
+        get = conn_elem.get
+        from_field = get('FROMFIELD')
+        from_instance = get('FROMINSTANCE')
+        to_field = get('TOFIELD')
+        to_instance = get('TOINSTANCE')
         
-        for port_elem in port_elements:
-            port = Port(
-                name=port_elem.get('NAME', 'Unknown'),
-                datatype=port_elem.get('DATATYPE', 'string'),
-                precision=self._safe_int(port_elem.get('PRECISION')),
-                scale=self._safe_int(port_elem.get('SCALE')),
-                nullable=port_elem.get('NULLABLE', 'NOTNULL'),
-                port_type=port_elem.get('PORTTYPE', 'INPUT'),
-                expression=port_elem.get('EXPRESSION')
+        if from_field and from_instance and to_field and to_instance:
+            connection = Connection(
+                from_transformation=from_instance,
+                from_port=from_field,
+                to_transformation=to_instance,
+                to_port=to_field
             )
-            ports.append(port)
-        
-        return ports
+            mapping.connections.append(connection)
+
+
+class _StopParsing(Exception):
+    """Raised from expat handlers once the mapping has been read"""
+
+
+class InformaticaExpatParser(InformaticaXMLParser):
+    """Parser for very large Informatica mapping XML files
     
-    def _parse_properties(self, trans_elem) -> Dict[str, str]:
-        """Parse transformation properties"""
-        properties = {}
-        
-        # Get all attributes as properties
-        properties.update(trans_elem.attrib)
+    Drives expat directly, so no Element objects are created. Produces the
+    same Mapping as InformaticaXMLParser; the visitors only call .get() on
+    what they are given, so expat's attribute dicts stand in for elements.
+    Namespaced names are reported as '{uri}name', as ElementTree does.
+    """
+    
+    # Bytes fed to expat per call
+    CHUNK_SIZE = 64 * 1024
+    
+    def parse(self) -> Mapping:
+        """Parse the XML file and return Mapping object"""
+        self._mapping_visitors = {
+            'TRANSFORMATION': self._visit_transformation,
+            'CONNECTOR': self._visit_connector,
+        }
+        self._transformation_visitors = {
+            'TRANSFORMFIELD': self._visit_transformfield,
+            'TABLEATTRIBUTE': self._visit_tableattribute,
+        }
+        self._mapping = None
+        self._mapping_depth = 0
+        self._transformation = None
+        self._folder = None
+        self._depth = 0
         
-        # Look for additional property elements
-        for prop_elem in trans_elem.findall('.//TABLEATTRIBUTE'):
-            prop_name = prop_elem.get('NAME')
-            prop_value = prop_elem.get('VALUE')
-            if prop_name and prop_value:
-                properties[prop_name] = prop_value
+        # expat reports namespaced names as 'uri}name'; _start adds the '{'
+        parser = expat.ParserCreate(namespace_separator='}')
+        parser.StartElementHandler = self._start
+        parser.EndElementHandler = self._end
         
-        return properties
-    
-    def _parse_connections(self, mapping_elem) -> List[Connection]:
-        """Parse all connections (links) between transformations"""
-        connections = []
+        try:
+            with open(self.xml_path, 'rb') as xml_file:
+                chunk = xml_file.read(self.CHUNK_SIZE)
+                while chunk:
+                    parser.Parse(chunk, False)
+                    chunk = xml_file.read(self.CHUNK_SIZE)
+                parser.Parse(b'', True)
+        except _StopParsing:
+            pass
         
-        # Find all connector elements
-        connector_elements = mapping_elem.findall('.//CONNECTOR')
+        mapping = self._mapping
+        self._mapping = self._transformation = None
+        if mapping is None:
+            raise ValueError("No MAPPING element found in XML")
         
-        for conn_elem in connector_elements:
-            from_field = conn_elem.get('FROMFIELD')
-            from_instance = conn_elem.get('FROMINSTANCE')
-            to_field = conn_elem.get('TOFIELD')
-            to_instance = conn_elem.get('TOINSTANCE')
-            
-            if all([from_field, from_instance, to_field, to_instance]):
-                connection = Connection(
-                    from_transformation=from_instance,
-                    from_port=from_field,
-                    to_transformation=to_instance,
-                    to_port=to_field
+        return mapping
+    
+    def _start(self, tag: str, attrs: Dict[str, str]):
+        """Handle an element start event"""
+        self._depth += 1
+        if '}' in tag:
+            tag = '{' + tag
+        if self._mapping is None:
+            if tag == 'FOLDER' and self._folder is None:
+                self._folder = attrs.get('NAME')
+            elif tag == 'MAPPING':
+                self._mapping = Mapping(
+                    name=attrs.get('NAME', 'Unknown'),
+                    description=attrs.get('DESCRIPTION'),
+                    folder=self._folder
                 )
-                connections.append(connection)
+                self._mapping_depth = self._depth
+            return
         
-        return connections
+        depth = self._depth - self._mapping_depth
+        if depth == 1:
+            visitor = self._mapping_visitors.get(tag)
+            if visitor is not None:
+                # All attribute names end up as transformation properties
+                if any('}' in name for name in attrs):
+                    attrs = {('{' + name if '}' in name else name): value
+                             for name, value in attrs.items()}
+                self._transformation = visitor(self._mapping, attrs)
+        elif depth == 2 and self._transformation is not None:
+            visitor = self._transformation_visitors.get(tag)
+            if visitor is not None:
+                visitor(self._transformation, attrs)
+    
+    def _end(self, tag: str):
+        """Handle an element end event"""
+        self._depth -= 1
+        if self._mapping is not None:
+            depth = self._depth - self._mapping_depth
+            if depth == 0:
+                self._transformation = None
+            elif depth < 0:
+                # Only the first mapping is parsed
+                raise _StopParsing
+
+
+def _parse_file(parser_cls, xml_path: str) -> Mapping:
+    """Parse one file in a worker process"""
+    return parser_cls(xml_path).parse()
+
+
+def parse_many(xml_paths: List[str], workers: Optional[int] = None,
+               parser_cls=InformaticaXMLParser) -> Iterator[Tuple[str, Mapping]]:
+    """Parse mapping XML files in parallel processes
+    
+    Yields (xml_path, mapping) pairs as each file finishes, so callers can
+    handle one result before the next arrives. Files not yet started are
+    dropped if the caller stops early or a worker raises.
+    """
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = {
+            executor.submit(_parse_file, parser_cls, xml_path): xml_path
+            for xml_path in xml_paths
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+class ModelEncoder(json.JSONEncoder):
+    """JSON encoder that serializes the mapping model dataclasses field by field"""
     
-    @staticmethod
-    def _safe_int(value: Optional[str]) -> Optional[int]:
-        """Safely convert string to int"""
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except (ValueError, TypeError):
-            return None
+    # Public fields of each model class, in declaration order
+    MODEL_FIELDS = {
+        cls: tuple(name for name in cls.__slots__ if not name.startswith('_'))
+        for cls in (Port, Transformation, Connection, Mapping)
+    }
+    
+    def default(self, o):
+        names = self.MODEL_FIELDS.get(type(o))
+        if names is None:
+            return super().default(o)
+        return {name: getattr(o, name) for name in names}
 
 
 def print_mapping_summary(mapping: Mapping):
     """Print a detailed summary of the mapping"""
-    print("=" * 80)
-    print(f"MAPPING SUMMARY: {mapping.name}")
-    print("=" * 80)
+    # Collect the report and write it to stdout in one call
+    lines = []
+    add = lines.append
+    
+    add("=" * 80)
+    add(f"MAPPING SUMMARY: {mapping.name}")
+    add("=" * 80)
     
     summary = mapping.get_summary()
     
-    print(f"\n📁 Folder: {summary['folder']}")
-    print(f"📊 Total Transformations: {summary['total_transformations']}")
-    print(f"🔗 Total Connections: {summary['total_connections']}")
-    print(f"📥 Source Count: {summary['sources']}")
-    print(f"📤 Target Count: {summary['targets']}")
+    add(f"\n📁 Folder: {summary['folder']}")
+    add(f"📊 Total Transformations: {summary['total_transformations']}")
+    add(f"🔗 Total Connections: {summary['total_connections']}")
+    add(f"📥 Source Count: {summary['sources']}")
+    add(f"📤 Target Count: {summary['targets']}")
     
-    print("\n" + "=" * 80)
-    print("TRANSFORMATION BREAKDOWN")
-    print("=" * 80)
+    add("\n" + "=" * 80)
+    add("TRANSFORMATION BREAKDOWN")
+    add("=" * 80)
     
     for trans_type, count in sorted(summary['transformation_counts'].items()):
-        print(f"  {trans_type:.<50} {count:>3}")
+        add(f"  {trans_type:.<50} {count:>3}")
     
-    print("\n" + "=" * 80)
-    print("SOURCE TRANSFORMATIONS")
-    print("=" * 80)
+    add("\n" + "=" * 80)
+    add("SOURCE TRANSFORMATIONS")
+    add("=" * 80)
     
-    for source in mapping.get_sources():
-        print(f"\n  📥 {source.name}")
-        print(f"     Type: {source.type}")
-        print(f"     Ports: {len(source.ports)}")
+    for source in mapping.sources:
+        add(f"\n  📥 {source.name}")
+        add(f"     Type: {source.type}")
+        add(f"     Ports: {len(source.ports)}")
         if source.ports:
-            print("     Sample Ports:")
-            for port in source.ports[:5]:  # Show first 5 ports
-                print(f"       - {port.name} ({port.datatype})")
-    
-    print("\n" + "=" * 80)
-    print("TARGET TRANSFORMATIONS")
-    print("=" * 80)
-    
-    for target in mapping.get_targets():
-        print(f"\n  📤 {target.name}")
-        print(f"     Type: {target.type}")
-        print(f"     Ports: {len(target.ports)}")
+            add("     Sample Ports:")
+            lines.extend(f"       - {port.name} ({port.datatype})"
+                         for port in source.ports[:5])  # Show first 5 ports
+    
+    add("\n" + "=" * 80)
+    add("TARGET TRANSFORMATIONS")
+    add("=" * 80)
+    
+    for target in mapping.targets:
+        add(f"\n  📤 {target.name}")
+        add(f"     Type: {target.type}")
+        add(f"     Ports: {len(target.ports)}")
         if target.ports:
-            print("     Sample Ports:")
-            for port in target.ports[:5]:  # Show first 5 ports
-                print(f"       - {port.name} ({port.datatype})")
+            add("     Sample Ports:")
+            lines.extend(f"       - {port.name} ({port.datatype})"
+                         for port in target.ports[:5])  # Show first 5 ports
     
-    print("\n" + "=" * 80)
-    print("TRANSFORMATION DETAILS")
-    print("=" * 80)
+    add("\n" + "=" * 80)
+    add("TRANSFORMATION DETAILS")
+    add("=" * 80)
     
     for trans in mapping.transformations:
         if trans.type not in ['Source Definition', 'Target Definition']:
-            print(f"\n  🔧 {trans.name}")
-            print(f"     Type: {trans.type}")
-            print(f"     Ports: {len(trans.ports)}")
+            add(f"\n  🔧 {trans.name}")
+            add(f"     Type: {trans.type}")
+            add(f"     Ports: {len(trans.ports)}")
             
             # Show expressions if present
             expr_ports = [p for p in trans.ports if p.expression]
             if expr_ports:
-                print(f"     Expressions: {len(expr_ports)}")
-                for port in expr_ports[:3]:  # Show first 3 expressions
-                    print(f"       - {port.name} = {port.expression}")
+                add(f"     Expressions: {len(expr_ports)}")
+                lines.extend(f"       - {port.name} = {port.expression}"
+                             for port in expr_ports[:3])  # Show first 3 expressions
     
-    print("\n" + "=" * 80)
-    print("DATA FLOW (First 10 connections)")
-    print("=" * 80)
+    add("\n" + "=" * 80)
+    add("DATA FLOW (First 10 connections)")
+    add("=" * 80)
     
-    for i, conn in enumerate(mapping.connections[:10], 1):
-        print(f"  {i:>2}. {conn}")
+    lines.extend(f"  {i:>2}. {conn}" for i, conn in enumerate(mapping.connections[:10], 1))
     
     if len(mapping.connections) > 10:
-        print(f"  ... and {len(mapping.connections) - 10} more connections")
+        add(f"  ... and {len(mapping.connections) - 10} more connections")
+    
+    add("\n" + "=" * 80)
     
-    print("\n" + "=" * 80)
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def export_to_json(mapping: Mapping, output_path: str):
     """Export mapping to JSON format"""
-    data = {
-        "name": mapping.name,
-        "description": mapping.description,
-        "folder": mapping.folder,
-        "transformations": [
-            {
-                "name": t.name,
-                "type": t.type,
-                "description": t.description,
-                "ports": [
-                    {
-                        "name": p.name,
-                        "datatype": p.datatype,
-                        "precision": p.precision,
-                        "scale": p.scale,
-                        "nullable": p.nullable,
-                        "port_type": p.port_type,
-                        "expression": p.expression
-                    }
-                    for p in t.ports
-                ],
-                "properties": t.properties
-            }
-            for t in mapping.transformations
-        ],
-        "connections": [
-            {
-                "from_transformation": c.from_transformation,
-                "from_port": c.from_port,
-                "to_transformation": c.to_transformation,
-                "to_port": c.to_port
-            }
-            for c in mapping.connections
-        ]
-    }
-    
-    with open(output_path, 'w') as f:
-        json.dump(data, f, indent=2)
+    data = None
+    if orjson is not None:
+        # orjson serializes the dataclasses directly (private fields are skipped)
+        try:
+            data = orjson.dumps(mapping, option=orjson.OPT_INDENT_2)
+        except orjson.JSONEncodeError:
+            # e.g. a PRECISION beyond 64 bits; the stdlib encoder handles it
+            data = None
+    
+    if data is not None:
+        with open(output_path, 'wb') as f:
+            f.write(data)
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(mapping, f, indent=2, cls=ModelEncoder)
     
     print(f"\n✅ Mapping exported to: {output_path}")
 
 
 # Example usage
 if __name__ == "__main__":
-    import sys
-
-    xml_file = 'test.xml'
+    xml_files = sys.argv[1:] or ['test.xml']
     
     try:
-        # Parse the XML
-        print(f"🔄 Parsing Informatica mapping: {xml_file}")
-        parser = InformaticaXMLParser(xml_file)
-        mapping = parser.parse()
-        
-        # Print summary
-        print_mapping_summary(mapping)
-        
-        # Export to JSON
-        json_output = xml_file.replace('.xml', '_parsed.json')
-        export_to_json(mapping, json_output)
+        if len(xml_files) == 1:
+            xml_file = xml_files[0]
+            
+            # Parse the XML
+            print(f"🔄 Parsing Informatica mapping: {xml_file}")
+            parser = InformaticaXMLParser(xml_file)
+            mapping = parser.parse()
+            
+            # Print summary
+            print_mapping_summary(mapping)
+            
+            # Export to JSON
+            json_output = xml_file.replace('.xml', '_parsed.json')
+            export_to_json(mapping, json_output)
+        else:
+            # Parse in parallel, exporting each mapping as soon as it is ready
+            print(f"🔄 Parsing {len(xml_files)} Informatica mappings")
+            for xml_file, mapping in parse_many(xml_files):
+                json_output = xml_file.replace('.xml', '_parsed.json')
+                export_to_json(mapping, json_output)
         
         print("\n✅ Parsing completed successfully!")
         
@@ -0,0 +1,42 @@
+# cython: language_level=3
+"""
+Compiled helpers for the Informatica mapping XML parser
+Optional: main.py falls back to its pure-Python visitors when not built
+"""
+
+from sys import intern
+
+
+cpdef object to_int(object value):
+    """Convert string to int, or None if it isn't a valid integer (see main._to_int)
+    
+    >>> to_int('12'), to_int('-3'), to_int(''), to_int('abc')
+    (12, -3, None, None)
+    >>> to_int('9' * 5000) is None  # beyond int()'s digit limit
+    True
+    """
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+cpdef object build_port(object port_cls, object port_elem):
+    """Build a port_cls instance from a TRANSFORMFIELD element"""
+    cdef object get = port_elem.get
+    cdef str name = get('NAME', 'Unknown')
+    # Categorical values repeat across ports, so share one string each
+    cdef str datatype = intern(get('DATATYPE', 'string'))
+    cdef str nullable = intern(get('NULLABLE', 'NOTNULL'))
+    cdef str port_type = intern(get('PORTTYPE', 'INPUT'))
+    return port_cls(
+        name,
+        datatype,
+        to_int(get('PRECISION')),
+        to_int(get('SCALE')),
+        nullable,
+        port_type,
+        get('EXPRESSION')
+    )
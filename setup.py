@@ -0,0 +1,42 @@
+"""
+Optional build of the compiled parser helpers (parser_fast.pyx)
+
+    python setup.py build_ext --inplace
+
+main.py runs without the extension; it is skipped when Cython or a C
+compiler isn't available.
+"""
+
+from setuptools import setup
+from setuptools.command.build_ext import build_ext
+from setuptools.errors import CCompilerError, ExecError, PlatformError
+
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    cythonize = None
+
+
+class OptionalBuildExt(build_ext):
+    """build_ext that warns instead of failing without a C toolchain"""
+    
+    def run(self):
+        try:
+            super().run()
+        except PlatformError as e:
+            print(f"⚠️  Skipping compiled parser helpers: {e}")
+    
+    def build_extension(self, ext):
+        try:
+            super().build_extension(ext)
+        except (CCompilerError, ExecError, PlatformError) as e:
+            print(f"⚠️  Skipping {ext.name}: {e}")
+
+
+setup(
+    name='migration',
+    python_requires='>=3.10',
+    py_modules=['main'],
+    ext_modules=cythonize('parser_fast.pyx') if cythonize else [],
+    cmdclass={'build_ext': OptionalBuildExt},
+)